@@ -1,28 +1,254 @@
-from enum import Enum, auto
-from typing import List, Optional, Self
-
-
-class Player(Enum):
-    YOU = auto()
-    OTHER = auto()
-    UNKNOWN = auto()
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Self, Tuple, Type
+
+import numpy as np
+from numba import njit
+
+
+# Players as plain ints so the turn changes with `1 - player`
+YOU = 0
+OTHER = 1
+
+# Smallest Trie whose winner search is split across threads, below it thread
+# startup outweighs the search
+_PARALLEL_MIN_NODES = 1 << 15
+
+# Attributes of Trie.Nodes written by Trie.save, arrays are trimmed to the nodes in use
+_SAVED_ARRAYS = ("children", "mask", "ender", "wins", "best", "settled", "tail", "hops")
+_SAVED_FLAGS = ("depth", "shared", "frozen", "solved", "compressed")
+
+
+@njit(cache=True, nogil=True)
+def _update_winners(
+    children: np.ndarray,
+    mask: np.ndarray,
+    ender: np.ndarray,
+    wins: np.ndarray,
+    best: np.ndarray,
+    settled: np.ndarray,
+    tail: np.ndarray,
+    hops: np.ndarray,
+    head: int,
+    max_depth: int,
+) -> None:
+    """Compiled post-order DFS behind Trie.update_winners. Labels whether the player
+    to move at each level forces a win, which doesn't depend on who started, so a
+    settled level is reused by every later search, whatever the prefix or first
+    move, and so are subtrees shared by several parents. Levels are kept on an
+    explicit stack, as numba handles recursion poorly. Once a letter forces a win,
+    the remaining letters of that level are pruned and stay unsettled until a
+    search starts below them. Alongside each result, records the letter the winner
+    plays, so the winning word is read off without another search. Chains of single
+    letters compressed by Trie.compress are jumped to their tail in one step.
+
+    :param int head: Id of node the DFS starts from
+    :param int max_depth: Upper bound on the depth of any node below head
+    """
+    if settled[head]:
+        return
 
-    def change_turn(self) -> Self:
-        if self == Player.UNKNOWN:
-            raise NotImplementedError(f"{Player.UNKNOWN} is for unitialized states")
-        return Player.OTHER if self == Player.YOU else Player.YOU
+    stack = np.empty(max_depth + 1, dtype=np.uint32)  # Node id at each depth
+    tops = np.empty(max_depth + 1, dtype=np.uint32)  # Chain it was reached from
+    nxt = np.zeros(max_depth + 1, dtype=np.int64)  # Next child position to visit
+    stack[0] = head
+    tops[0] = head
+    # Until a letter forces a win for the player to move, the other player wins
+    wins[head] = False
+    best[head] = -1
+    depth = 0
+
+    while depth >= 0:
+        curr = stack[depth]
+        c = nxt[depth]
+        # A forced win for the player to move can't be changed by remaining letters,
+        # and a chain tail settled by an earlier search needs no letters at all
+        m = 0 if wins[curr] or settled[curr] else np.int64(mask[curr]) >> c
+
+        if m:  # DFS, descends into next unvisited letter
+            while not m & 1:
+                m >>= 1
+                c += 1
+            nxt[depth] = c + 1
+            child = children[curr, c]
+            if best[curr] < 0:
+                best[curr] = c  # Any letter works when no letter forces a win
+            if settled[child]:
+                # Settled by an earlier search or a shared subtree, so reuse it
+                if not wins[child]:
+                    wins[curr] = True
+                    best[curr] = c
+                continue
+
+            depth += 1
+            tops[depth] = child
+            if hops[child]:
+                # Every level down to the tail has one letter, so no choices
+                child = tail[child]
+            stack[depth] = child
+            nxt[depth] = 0
+            if not settled[child]:
+                wins[child] = False
+                best[child] = -1
+            continue
+
+        # All letters visited, so the winner of this level is settled
+        if ender[curr]:
+            wins[curr] = True
+        settled[curr] = True
+
+        top = tops[depth]
+        if top != curr:
+            # Each letter of the chain hands the move over, and best of a single
+            # letter level was set by Trie.compress
+            wins[top] = wins[curr] != (hops[top] & 1)
+            settled[top] = True
+            curr = top
+
+        depth -= 1
+        # A letter where the next player loses is a forced win for the parent
+        if depth >= 0 and not wins[curr]:
+            wins[stack[depth]] = True
+            best[stack[depth]] = nxt[depth] - 1
+
+
+@njit(cache=True, nogil=True)
+def _reachable(children: np.ndarray, mask: np.ndarray, size: int) -> np.ndarray:
+    """Compiled forward scan marking the nodes reachable from the root. Parents
+    always come before their children, so one pass in id order is enough
+
+    :param int size: Number of nodes in use
+    :return np.ndarray: If each node is reachable
+    """
+    keep = np.zeros(size, dtype=np.bool_)
+    keep[0] = True
+    for node in range(size):
+        if keep[node] and mask[node]:
+            for child in children[node]:
+                if child:
+                    keep[child] = True
+    return keep
 
 
 class Trie:
     """Trie with additional methods to solve the game Ghost optimally"""
 
-    class Node:
-        """Node of Trie, with rbase leaves"""
+    __slots__ = ("rbase", "first_move", "refchar", "_base", "pref", "nodes", "head")
+
+    class Nodes:
+        """Nodes of Trie stored as parallel arrays indexed by uint32 node ids. Id 0 is
+        the root, which is never a child, so a child slot of 0 means no child"""
+
+        __slots__ = (
+            "size",
+            "depth",
+            "shared",
+            "frozen",
+            "children",
+            "mask",
+            "wins",
+            "best",
+            "settled",
+            "solved",
+            "tail",
+            "hops",
+            "compressed",
+            "ender",
+        )
+
+        def __init__(self, rbase: int = 26, capacity: int = 64):
+            if rbase > 32:
+                raise ValueError(f"rbase {rbase} does not fit in a 32 bit child mask")
+            self.size = 1  # Root is always allocated
+            self.depth = 0  # Bound on the depth of any node, sizes the DFS stack
+            self.shared = False  # If identical subtrees were merged into one
+            self.frozen = False  # If the arrays were trimmed and made read only
+            self.children = np.zeros((capacity, rbase), dtype=np.uint32)
+            # Bitmap of occupied child slots, so traversals skip empty slots
+            self.mask = np.zeros(capacity, dtype=np.uint32)
+            # If the player to move at a level forces a win
+            self.wins = np.zeros(capacity, dtype=np.bool_)
+            # Position of the letter the winner plays from a level, -1 at word ends
+            self.best = np.full(capacity, -1, dtype=np.int8)
+            # If wins and best of a level are final, reset whenever words are added
+            self.settled = np.zeros(capacity, dtype=np.bool_)
+            self.solved = False  # If any level is settled
+            # First level below a level that has a choice or ends a word, and the
+            # number of single letters to it, hops of 0 means no chain to jump
+            self.tail = np.zeros(capacity, dtype=np.uint32)
+            self.hops = np.zeros(capacity, dtype=np.uint32)
+            self.compressed = False  # If chains of single letters are recorded
+            self.ender = np.zeros(capacity, dtype=np.bool_)  # If level ends a word
+
+        def add_node(self) -> int:
+            """Allocates a new node, doubling the arrays when they are full
+
+            :return int: Id of the new node
+            """
+            if self.size == len(self.ender):
+                self._resize(2 * self.size)
+
+            self.size += 1
+            return self.size - 1
+
+        def _lock(self) -> None:
+            for array in (self.children, self.mask, self.ender):
+                array.flags.writeable = False
+
+        def _compact(self) -> np.ndarray:
+            """Drops the rows of nodes no longer reachable from the root, left by
+            words pruning longer words or by share_subtrees, keeping the order of
+            the rest so children still follow their parents
 
-        def __init__(self, rbase: int = 26):
-            self.letters: List[Optional[Trie.Node]] = [None for _ in range(rbase)]
-            self.winner: Player = Player.UNKNOWN  # Winner of current level
-            self.ender = False  # If current level is an ending word
+            :return np.ndarray: New id of every old id, only valid for kept nodes
+            """
+            size = self.size
+            keep = _reachable(self.children, self.mask, size)
+
+            tail = self.tail[:size]
+            chained = keep & (self.hops[:size] > 0)
+            if not keep[tail[chained]].all():
+                # A chain ends in a dropped row, so chains are no longer jumped
+                self.hops[:] = 0
+                self.compressed = False
+
+            remap = (np.cumsum(keep) - 1).astype(np.uint32)  # Root stays 0
+            self.children = remap[self.children[:size][keep]]
+            self.tail = remap[tail[keep]]  # Only read where hops is nonzero
+            self.mask = self.mask[:size][keep]
+            self.ender = self.ender[:size][keep]
+            self.wins = self.wins[:size][keep]
+            self.best = self.best[:size][keep]
+            self.settled = self.settled[:size][keep]
+            self.hops = self.hops[:size][keep]
+            self.size = len(self.ender)
+            return remap
+
+        def _resize(self, capacity: int) -> None:
+            # np.resize repeats existing rows, so copy into fresh arrays instead
+            children = np.zeros((capacity, self.children.shape[1]), dtype=np.uint32)
+            mask = np.zeros(capacity, dtype=np.uint32)
+            wins = np.zeros(capacity, dtype=np.bool_)
+            best = np.full(capacity, -1, dtype=np.int8)
+            settled = np.zeros(capacity, dtype=np.bool_)
+            tail = np.zeros(capacity, dtype=np.uint32)
+            hops = np.zeros(capacity, dtype=np.uint32)
+            ender = np.zeros(capacity, dtype=np.bool_)
+
+            children[: self.size] = self.children[: self.size]
+            mask[: self.size] = self.mask[: self.size]
+            wins[: self.size] = self.wins[: self.size]
+            best[: self.size] = self.best[: self.size]
+            settled[: self.size] = self.settled[: self.size]
+            tail[: self.size] = self.tail[: self.size]
+            hops[: self.size] = self.hops[: self.size]
+            ender[: self.size] = self.ender[: self.size]
+
+            self.children, self.mask = children, mask
+            self.wins, self.best, self.settled = wins, best, settled
+            self.tail, self.hops = tail, hops
+            self.ender = ender
 
     def __init__(
         self,
@@ -30,20 +256,104 @@ class Trie:
         rbase: int = 26,
         refchar: str = "a",
         pref: str = "",
-        head: Optional[Node] = None,
+        head: int = 0,
+        nodes: Optional[Nodes] = None,
     ):
         self.rbase = rbase
         self.first_move = first_move
         self.refchar = refchar
+        self._base = ord(refchar)  # Position of a letter is its ord minus base
         self.pref = pref
 
-        self.head = Trie.Node(rbase) if head is None else head
+        # Tries returned by find_prefix share nodes and start from another head
+        self.nodes = Trie.Nodes(rbase) if nodes is None else nodes
+        self.head = head
 
-    def _pos(self, char: str) -> int:
-        return ord(char) - ord(self.refchar)
+    @classmethod
+    def from_sorted_words(
+        cls,
+        words: List[str],
+        first_move: bool = True,
+        rbase: int = 26,
+        refchar: str = "a",
+    ) -> Self:
+        """Bulk loads a Trie from a word list. Words are sorted, then nodes are
+        allocated breadth first so every level, and the siblings within it, sit
+        contiguously in the node arrays. Same Trie as calling add_word on each word.
+
+        :param List[str] words: Lowercase words, in any order
+        :return Trie: Trie holding every word
+        """
+        trie = cls(first_move, rbase, refchar)
+        nodes = trie.nodes
+        base = trie._base
+        nodes.depth = max(map(len, words), default=0)
+        words = sorted(words)
+        if not words:
+            return trie
+
+        # Nodes of the current level with the range of sorted words through them
+        level = [(trie.head, 0, len(words))]
+        depth = 0
+
+        while level:
+            next_level = []
+            enders, parents, positions = [], [], []
+            size = nodes.size
+            for curr, lo, hi in level:
+                # Sorting puts a word ending at this level first, and the game
+                # ends at any end of word, so its longer words are pruned
+                if len(words[lo]) == depth:
+                    enders.append(curr)
+                    continue
 
-    def _char(self, pos: int) -> str:
-        return chr(pos + ord(self.refchar))
+                # Words sharing the next letter are adjacent, one child per run
+                letter, start = words[lo][depth], lo
+                for i in range(lo + 1, hi + 1):
+                    if i < hi and words[i][depth] == letter:
+                        continue
+                    parents.append(curr)
+                    positions.append(ord(letter) - base)
+                    next_level.append((size, start, i))
+                    size += 1
+                    if i < hi:
+                        letter, start = words[i][depth], i
+
+            # Writes the whole level at once instead of a node at a time
+            capacity = len(nodes.ender)
+            while capacity < size:
+                capacity *= 2
+            if capacity > len(nodes.ender):
+                nodes._resize(capacity)
+            nodes.ender[enders] = True
+            pos = np.array(positions, dtype=np.uint32)
+            nodes.children[parents, pos] = np.arange(nodes.size, size, dtype=np.uint32)
+            np.bitwise_or.at(nodes.mask, parents, np.left_shift(np.uint32(1), pos))
+            nodes.size = size
+
+            level = next_level
+            depth += 1
+
+        return trie
+
+    def _positions(self, word: str) -> List[int]:
+        """Converts every letter of word to its child slot position. Alphabet
+        specialized classes from _make_trie_class replace it with a byte table
+
+        :param str word: Any lowercase word
+        :return List[int]: Child slot position of each letter
+        """
+        base = self._base
+        return [ord(letter) - base for letter in word]
+
+    def _letters(self, positions: List[int]) -> str:
+        """Converts child slot positions back to the letters they stand for
+
+        :param List[int] positions: Child slot position of each letter
+        :return str: Word spelled by the positions
+        """
+        base = self._base
+        return "".join(chr(i + base) for i in positions)
 
     def find_prefix(self, prefix: str) -> Self:
         """Traverses trie according to prefix and returns a wrapper around current node
@@ -51,22 +361,25 @@ class Trie:
         :param str prefix: Specified prefix of starting word
         :return Trie: Trie to traverse and find next best word
         """
+        nodes = self.nodes
+        children, ender = nodes.children, nodes.ender
         curr = self.head
 
-        for letter in prefix:
-            if curr.ender or curr.letters[self._pos(letter)] is None:
+        for pos in self._positions(prefix):
+            child = int(children[curr, pos])
+            if ender[curr] or child == 0:
                 raise Exception("No word with prefix found")
 
-            # Traverses and adds word to Trie, mypy error with guard clause
-            curr = curr.letters[self._pos(letter)] # type: ignore
+            curr = child
 
         # Wraps remaining nodes in a new Trie
-        return Trie(
+        return type(self)(
             self.first_move != len(prefix) % 2,
             self.rbase,
             self.refchar,
             self.pref + prefix,
             curr,
+            nodes,
         )
 
     def add_word(self, word: str) -> None:
@@ -74,103 +387,313 @@ class Trie:
         if at the end, there's words that use the base, the following leaves
         are pruned because game ends at any end of word. O(n) time where n
         is length of word. O(n) space added, as for every new letter,
-        we create another constant size dictionary per letter.
+        we create another constant size dictionary per letter. Pruned leaves
+        stay allocated, unreachable, until freeze. from_sorted_words never
+        allocates them.
 
         :param str word: Any lowercase word
         """
+        nodes = self.nodes
+        if nodes.shared or nodes.frozen:
+            raise Exception("Can't add words once subtrees are shared or frozen")
+        if nodes.solved:
+            # New words can change the winner of every level above them
+            nodes.settled[:] = False
+            nodes.solved = False
+        if nodes.compressed:
+            # New words can branch off any chain, so chains are no longer jumped
+            nodes.hops[:] = 0
+            nodes.compressed = False
+
         curr = self.head
+        nodes.depth = max(nodes.depth, len(self.pref) + len(word))
 
-        for letter in word:
-            if curr.ender:
+        for pos in self._positions(word):
+            if nodes.ender[curr]:
                 break
 
-            if curr.letters[self._pos(letter)] is None:
-                curr.letters[self._pos(letter)] = Trie.Node(self.rbase)
+            child = int(nodes.children[curr, pos])
+            if child == 0:
+                # add_node may reallocate the arrays, so allocate before indexing
+                child = nodes.add_node()
+                nodes.children[curr, pos] = child
+                nodes.mask[curr] |= 1 << pos
 
-            # Traverses and adds word to Trie, mypy error with guard clause
-            curr = curr.letters[self._pos(letter)]  # type: ignore
+            curr = child
 
-        curr.ender = True
-        # Cleans out leaves of finishing letter
-        curr.letters = [None for _ in range(len(curr.letters))]
+        nodes.ender[curr] = True
+        if nodes.mask[curr]:
+            # Cleans out leaves of finishing letter, new leaves have none to clean
+            nodes.children[curr] = 0
+            nodes.mask[curr] = 0
         return
 
-    def update_winners(self) -> None:
+    def share_subtrees(self) -> None:
+        """Merges subtrees with identical futures, turning the Trie into a DAG that
+        update_winners settles once per distinct subtree. Two levels match when
+        both end words or not, and have the same children after merging. Common
+        endings like "ing" or "ed" collapse into one subtree. Words can't be added
+        afterwards, and compress must be run again after. O(n) time where n is
+        number of nodes, but as a Python loop hashing every node it costs far more
+        than the compiled winner search it saves, seconds against milliseconds on
+        a large dictionary, so it only pays off for Tries that are saved and
+        loaded many times or when memory matters more than load time.
+        """
+        nodes = self.nodes
+        if nodes.frozen:
+            raise Exception("Can't share subtrees once frozen")
+        if nodes.solved:
+            # A merged level keeps only one duplicate's results, which may be unsettled
+            nodes.settled[:] = False
+            nodes.solved = False
+        if nodes.compressed:
+            # Chain tails may be merged away, so chains are no longer jumped
+            nodes.hops[:] = 0
+            nodes.compressed = False
+
+        children, size = nodes.children, nodes.size
+
+        canon = np.arange(size, dtype=np.uint32)  # Id each node is merged into
+        interned: Dict[Tuple[bool, bytes], int] = {}
+        # Children are always allocated after their parent, so descending ids
+        # merge every child before its parent
+        for node in range(size - 1, -1, -1):
+            if nodes.mask[node]:
+                children[node] = canon[children[node]]
+            if node:  # Root is never a child, so never merged
+                key = (bool(nodes.ender[node]), children[node].tobytes())
+                canon[node] = interned.setdefault(key, node)
+
+        nodes.shared = True
+
+    def freeze(self) -> None:
+        """Marks the Trie as done being written once all words are added. Trims the
+        node arrays to the nodes reachable from the root, dropping the slack left
+        by doubling and the rows of pruned or merged subtrees, and makes the arrays
+        describing the words read only. Words can't be added afterwards. Node ids
+        change, so prefix Tries made before freezing must be made again. O(n) time
+        where n is number of nodes.
+        """
+        nodes = self.nodes
+        self.head = int(nodes._compact()[self.head])
+        nodes._lock()
+        nodes.frozen = True
+
+    def compress(self) -> None:
+        """Path compresses chains of levels with a single letter, where the player to
+        move has no choice and the winner only flips with each letter. Each level
+        records the tail of its chain, the first level below with a choice or
+        ending a word, and the number of letters to it, so update_winners jumps
+        from the top of a chain to its tail in one step. Nodes and their letters
+        are unchanged, so find_prefix still stops anywhere in a chain. Adding
+        words undoes it. O(n) time where n is number of nodes.
+        """
+        nodes = self.nodes
+        mask, ender = nodes.mask, nodes.ender
+
+        # Children are always allocated after their parent, even once subtrees are
+        # shared, so descending ids compress every child before its parent
+        for node in range(nodes.size - 1, -1, -1):
+            m = int(mask[node])
+            if m and not m & (m - 1) and not ender[node]:  # Single letter
+                pos = m.bit_length() - 1
+                child = int(nodes.children[node, pos])
+                nodes.best[node] = pos  # The only move, whoever wins
+                nodes.tail[node] = nodes.tail[child]
+                nodes.hops[node] = nodes.hops[child] + 1
+            else:
+                nodes.tail[node] = node
+                nodes.hops[node] = 0
+
+        nodes.compressed = True
+
+    def update_winners(self, workers: Optional[int] = None) -> None:
         """Depth first search with alternating winners. Labels each node with what move
         an optimal turn player would make. O(n) time DFS where n is number of nodes.
-
-        :param bool odd_winner: Determines if you're starting on odd letter or even,
-        defaults to True
+        Runs as a compiled iterative DFS over the node arrays. Results don't depend
+        on who moves first, so levels settled by an earlier call, from this Trie or
+        any Trie sharing its nodes, are reused until words are added. When started
+        from the root of a large Trie, the subtrees below the root are settled in
+        parallel threads first, as the compiled DFS releases the GIL. Prefix Tries,
+        whose heads have comparatively small subtrees, and Tries with shared
+        subtrees always run serially.
+
+        :param Optional[int] workers: Threads settling subtrees, defaults to
+        ThreadPoolExecutor's default
         """
+        nodes = self.nodes
+
+        def settle(head: int) -> None:
+            _update_winners(
+                nodes.children,
+                nodes.mask,
+                nodes.ender,
+                nodes.wins,
+                nodes.best,
+                nodes.settled,
+                nodes.tail,
+                nodes.hops,
+                head,
+                nodes.depth,
+            )
+
+        # Subtrees below the head only write their own levels, unless subtrees are
+        # shared, where two threads could settle the same level at once. Only the
+        # root is known to have enough nodes below it to be worth the threads
+        if (
+            self.head == 0
+            and nodes.size >= _PARALLEL_MIN_NODES
+            and not nodes.shared
+            and not nodes.settled[self.head]
+        ):
+            row = nodes.children[self.head]
+            with ThreadPoolExecutor(workers) as pool:
+                list(pool.map(settle, row[row != 0].tolist()))  # Raises any error
+
+        settle(self.head)  # Only reads the winners of settled subtrees
+        nodes.solved = True
 
-        def recurse_update(curr_node: Trie.Node, turn_player: Player) -> None:
-            """Recursive update of Trie DFS. Will traverse to lowest word and determine
-            the winner. At parents, determines the winner for optimal turn player
+    def find_a_winner(self) -> str:
+        """Finds optimal move for YOU by following the letters update_winners
+        recorded for each winner. This is an O(m) time and space where m is length
+        of optimal word.
 
-            :param Trie.Node curr_dict: Current word level
-            :param Player turn_player: Current player, either Player.YOU or Player.OTHER
-            """
-            if curr_node.ender:
-                curr_node.winner = turn_player
+        :return str: Forced winning word for YOU. Returns "No valid winner" if no
+        valid words
+        """
+        self.update_winners()  # No search when the head is already settled
+        nodes = self.nodes
 
-            for letter in curr_node.letters:  # DFS
-                if letter is None:
-                    continue
-                recurse_update(letter, turn_player.change_turn())
-                # Checks if there's a move where turn_player forces a win
-                curr_node.winner = (
-                    turn_player if letter.winner == turn_player else curr_node.winner
-                )
+        mover = YOU if self.first_move else OTHER
+        if (mover if nodes.wins[self.head] else 1 - mover) != YOU:
+            return "No valid winning word"
 
-            if curr_node.winner == Player.UNKNOWN:
-                # If determined that there's no forcing winning move, meaning
-                # Only forcing winning moves for non-turn player
-                curr_node.winner = turn_player.change_turn()
+        children, best = nodes.children, nodes.best
+        path: List[int] = []  # Positions of the letters of the forced winning word
+        curr = self.head
 
-            return
+        while best[curr] >= 0:  # Every letter keeps the forced win until an ender
+            pos = int(best[curr])
+            path.append(pos)
+            curr = int(children[curr, pos])
 
-        recurse_update(self.head, Player.YOU if self.first_move else Player.OTHER)
+        return f"Winning word: {self.pref}{self._letters(path)}"
 
-    def find_a_winner(self) -> str:
-        """Finds optimal move for Player.YOU through a DFS of the Trie.
-        This is an O(m) time and space where m is length of optimal word.
+    def save(self, path: str) -> None:
+        """Saves the nodes, with any winners settled so far, and where this Trie
+        starts in them to an uncompressed .npz file. Arrays are written as raw
+        bytes, as there are no pointers between nodes, so load needs no parsing or
+        add_word calls. O(n) time where n is number of nodes.
 
-        :return str: Forced winning word for Player.YOU. Returns "No valid winner" if no
-        valid words
+        :param str path: File to save to, numpy appends .npz if missing
         """
+        nodes = self.nodes
+        np.savez(
+            path,
+            **{name: getattr(nodes, name)[: nodes.size] for name in _SAVED_ARRAYS},
+            **{name: getattr(nodes, name) for name in _SAVED_FLAGS},
+            first_move=self.first_move,
+            refchar=self.refchar,
+            pref=self.pref,
+            head=self.head,
+        )
 
-        def recurse_search(curr: Trie.Node) -> str:
-            leaf_index = -1  # Determines if we're at a forced win/ender point
-            for i, letter in enumerate(curr.letters):
-                if letter is None or letter.winner == Player.OTHER:
-                    continue
+    @classmethod
+    def load(cls, path: str) -> Self:
+        """Loads a Trie written by save, ready for queries without adding words
 
-                # Must be on level with only ender word choices to return a char
-                leaf_index = i if letter.ender and leaf_index >= -1 else -2
+        :param str path: File written by save, .npz is appended if missing as save
+        does
+        :return Trie: Trie starting where the saved Trie started
+        """
+        if not path.endswith(".npz"):
+            path += ".npz"
+
+        with np.load(path) as saved:
+            rbase = saved["children"].shape[1]
+            nodes = Trie.Nodes(rbase, capacity=1)
+            for name in _SAVED_ARRAYS:
+                setattr(nodes, name, saved[name])
+            for name in _SAVED_FLAGS:
+                setattr(nodes, name, saved[name].item())
+            nodes.size = len(nodes.ender)
+            if nodes.frozen:
+                nodes._lock()
+
+            return cls(
+                bool(saved["first_move"]),
+                rbase,
+                str(saved["refchar"]),
+                str(saved["pref"]),
+                int(saved["head"]),
+                nodes,
+            )
+
+
+@lru_cache(maxsize=None)
+def _make_trie_class(rbase: int, refchar: str) -> Type[Trie]:
+    """Builds a Trie subclass specialized to one alphabet. For ASCII alphabets,
+    letter conversions are byte translation tables built for the alphabet, so they
+    run in C without reading the alphabet off the instance
+
+    :param int rbase: Number of letters in the alphabet
+    :param str refchar: First letter of the alphabet
+    :return Type[Trie]: Trie subclass only usable with this alphabet
+    """
+    alphabet = (rbase, refchar)
+    base = ord(refchar)
+    to_positions = bytes((c - base) % 256 for c in range(256))
+    to_letters = bytes((i + base) % 256 for i in range(256))
 
-                # DFS, searches for a forced winning word, if it exists,
-                # Adds current character to recreate the word bottom up
-                return f"{self._char(i)}{recurse_search(letter)}"
+    def __init__(
+        self: Trie,
+        first_move: bool = True,
+        rbase: int = alphabet[0],
+        refchar: str = alphabet[1],
+        pref: str = "",
+        head: int = 0,
+        nodes: Optional[Trie.Nodes] = None,
+    ) -> None:
+        if (rbase, refchar) != alphabet:
+            raise ValueError(f"Trie is specialized to alphabet {alphabet}")
+        Trie.__init__(self, first_move, rbase, refchar, pref, head, nodes)
+
+    def from_sorted_words(
+        cls: Type[Trie],
+        words: List[str],
+        first_move: bool = True,
+        rbase: int = alphabet[0],
+        refchar: str = alphabet[1],
+    ) -> Trie:
+        load = Trie.from_sorted_words.__func__  # type: ignore
+        return load(cls, words, first_move, rbase, refchar)
 
-            # We've hit a forced win point, and the index gets char of win
-            if leaf_index >= 0:
-                return self._char(leaf_index)
-            # Nothing of use found, most likely a deadend leading to Player.OTHER victory
-            return ""
+    def _positions(self: Trie, word: str) -> List[int]:
+        return list(word.encode("ascii").translate(to_positions))
 
-        return (
-            f"Winning word: {self.pref}{recurse_search(self.head)}"
-            if self.head.winner == Player.YOU
-            else "No valid winning word"
-        )
+    def _letters(self: Trie, positions: List[int]) -> str:
+        return bytes(positions).translate(to_letters).decode("ascii")
 
+    namespace = {
+        "__module__": __name__,
+        "__slots__": (),
+        "__init__": __init__,
+        "from_sorted_words": classmethod(from_sorted_words),
+    }
+    if base + rbase <= 128:  # Other alphabets keep Trie's ord conversions
+        namespace.update(_positions=_positions, _letters=_letters)
+    return types.new_class(
+        f"Trie_{refchar}{rbase}", (Trie,), exec_body=lambda ns: ns.update(namespace)
+    )
 
-def test(prefix: str, words: List[str]) -> str:
-    d = Trie(True)
 
-    for word in words:
-        d.add_word(word)
+TrieEng = _make_trie_class(26, "a")  # Lowercase English alphabet
 
+
+def test(prefix: str, words: List[str]) -> str:
+    d = TrieEng.from_sorted_words(words, True)
+    d.freeze()
+    d.compress()
     d = d.find_prefix(prefix)
     d.update_winners()
 
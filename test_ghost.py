@@ -0,0 +1,132 @@
+import random
+from itertools import permutations
+from typing import Dict, List
+
+import pytest
+
+from ghost import Trie, TrieEng
+from ghost import test as solve
+
+
+def reference(prefix: str, words: List[str], first_move: bool = True) -> str:
+    """Solves Ghost by plain recursion over a dict trie, to check Trie against"""
+    trie: Dict = {}
+    for word in words:  # A word ends the game, so longer words after it are pruned
+        curr = trie
+        for letter in word:
+            if "$" in curr:
+                break
+            curr = curr.setdefault(letter, {})
+        curr.clear()
+        curr["$"] = True
+
+    def mover_wins(level: Dict) -> bool:
+        return "$" in level or any(
+            not mover_wins(child) for letter, child in level.items() if letter != "$"
+        )
+
+    curr = trie
+    for letter in prefix:
+        if "$" in curr or letter not in curr:
+            raise Exception("No word with prefix found")
+        curr = curr[letter]
+
+    you_move = first_move != len(prefix) % 2
+    if you_move != mover_wins(curr):
+        return "No valid winning word"
+
+    word = prefix
+    while "$" not in curr:
+        you_move = not you_move
+        # First letter after which YOU still wins, as Trie.find_a_winner picks
+        letter = next(
+            letter for letter in sorted(curr) if you_move == mover_wins(curr[letter])
+        )
+        word += letter
+        curr = curr[letter]
+    return f"Winning word: {word}"
+
+
+def outcome(trie: Trie, prefix: str) -> str:
+    try:
+        return trie.find_prefix(prefix).find_a_winner()
+    except Exception:
+        return "No word with prefix found"
+
+
+def expected(prefix: str, words: List[str], first_move: bool) -> str:
+    try:
+        return reference(prefix, words, first_move)
+    except Exception:
+        return "No word with prefix found"
+
+
+def random_words(rng: random.Random) -> List[str]:
+    alphabet = "abc"[: rng.randint(2, 3)]
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 7)))
+        for _ in range(rng.randint(1, 30))
+    ]
+
+
+def test_example():
+    words = ["hote", "lone", "bone", "horsewewew", "horseew"]
+    assert solve("h", words) == "Winning word: hote"
+
+
+STEPS = ("update_winners", "share_subtrees", "compress", "freeze")
+
+
+def can_run(steps: tuple) -> bool:
+    # Nothing can be shared once frozen
+    if "freeze" in steps and "share_subtrees" in steps:
+        return steps.index("share_subtrees") < steps.index("freeze")
+    return True
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        steps
+        for n in range(len(STEPS) + 1)
+        for steps in permutations(STEPS, n)
+        if can_run(steps)
+    ],
+)
+def test_matches_reference(steps):
+    rng = random.Random(" ".join(steps))
+    for _ in range(150):
+        words = random_words(rng)
+        first_move = rng.random() < 0.5
+        trie = TrieEng(first_move)
+        for word in words:
+            trie.add_word(word)
+        for step in steps:
+            getattr(trie, step)()
+
+        prefixes = {"", words[0][:1], words[-1][:2], rng.choice(words)}
+        for prefix in prefixes:
+            assert outcome(trie, prefix) == expected(prefix, words, first_move)
+
+
+def test_from_sorted_words_matches_add_word():
+    rng = random.Random(0)
+    for _ in range(200):
+        words = random_words(rng)
+        loaded = Trie.from_sorted_words(words)
+        for prefix in {"", words[0][:1], rng.choice(words)}:
+            assert outcome(loaded, prefix) == expected(prefix, words, True)
+
+
+
+def test_save_load(tmp_path):
+    words = ["hote", "lone", "bone", "horsewewew", "horseew"]
+    trie = TrieEng.from_sorted_words(words)
+    trie.freeze()
+    trie.update_winners()
+    trie.save(str(tmp_path / "dict"))  # Saved as dict.npz
+
+    for path in ("dict", "dict.npz"):
+        loaded = TrieEng.load(str(tmp_path / path))
+        assert type(loaded) is TrieEng
+        assert loaded.find_prefix("h").find_a_winner() == "Winning word: hote"